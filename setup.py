@@ -654,6 +654,18 @@ setup(
             extra_link_args=[] + omp_lib,
             sources=[op.join('src', 'gf', 'ext', 'store_ext.c')]),
 
+        Extension(
+            'gf.rect_discretize_ext',
+            include_dirs=[get_python_inc(), numpy.get_include()],
+            extra_compile_args=['-Wextra'],
+            sources=[op.join('src', 'gf', 'ext', 'rect_discretize_ext.c')]),
+
+        Extension(
+            'gf.post_process_ext',
+            include_dirs=[get_python_inc(), numpy.get_include()],
+            extra_compile_args=['-Wextra'],
+            sources=[op.join('src', 'gf', 'ext', 'post_process_ext.c')]),
+
         Extension(
             'eikonal_ext',
             include_dirs=[get_python_inc(), numpy.get_include()],
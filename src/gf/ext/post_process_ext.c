@@ -0,0 +1,298 @@
+#define NPY_NO_DEPRECATED_API 7
+
+#include "Python.h"
+#include "numpy/arrayobject.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+
+struct module_state {
+    PyObject *error;
+};
+
+#if PY_MAJOR_VERSION >= 3
+#define GETSTATE(m) ((struct module_state*)PyModule_GetState(m))
+#else
+#define GETSTATE(m) (&_state); (void) m;
+static struct module_state _state;
+#endif
+
+typedef npy_float32 float32_t;
+typedef npy_float64 float64_t;
+
+int good_array(PyObject* o, int typenum, npy_intp size_want, int ndim_want, npy_intp* shape_want) {
+    int i;
+
+    if (!PyArray_Check(o)) {
+        PyErr_SetString(PyExc_AttributeError, "not a NumPy array" );
+        return 0;
+    }
+
+    if (PyArray_TYPE((PyArrayObject*)o) != typenum) {
+        PyErr_SetString(PyExc_AttributeError, "array of unexpected type");
+        return 0;
+    }
+
+    if (!PyArray_ISCARRAY((PyArrayObject*)o)) {
+        PyErr_SetString(PyExc_AttributeError, "array is not contiguous or not well behaved");
+        return 0;
+    }
+
+    if (size_want != -1 && size_want != PyArray_SIZE((PyArrayObject*)o)) {
+        PyErr_SetString(PyExc_AttributeError, "array is of unexpected size");
+        return 0;
+    }
+
+    if (ndim_want != -1 && ndim_want != PyArray_NDIM((PyArrayObject*)o)) {
+        PyErr_SetString(PyExc_AttributeError, "array is of unexpected ndim");
+        return 0;
+    }
+
+    if (ndim_want != -1 && shape_want != NULL) {
+        for (i=0; i<ndim_want; i++) {
+            if (shape_want[i] != -1 && shape_want[i] != PyArray_DIMS((PyArrayObject*)o)[i]) {
+                PyErr_SetString(PyExc_AttributeError, "array is of unexpected shape");
+                return 0;
+            }
+        }
+    }
+    return 1;
+}
+
+#define MAX_COMPONENTS 8
+
+static void combine_convolve_stf(
+        size_t ncomponents,
+        const float32_t **datas,
+        const float64_t *factors,
+        size_t nd,
+        const float64_t *amplitudes,
+        size_t na,
+        float64_t *x,
+        float64_t *cumamp,
+        float64_t *y,
+        float32_t *out) {
+
+    /*
+     * out = (sum_c factors[c] * datas[c]) * amplitudes, where the combined
+     * trace is padded with its last sample on the right, truncated to
+     * nd + na - 1 samples. Contributions from the padding are taken from the
+     * running sum of the amplitudes. Everything is accumulated in double
+     * precision, only the result is stored as float.
+     */
+
+    size_t i, j, k, c;
+    float64_t a;
+    float64_t acc;
+
+    for (i=0; i<nd; i++) {
+        acc = 0.0;
+        for (c=0; c<ncomponents; c++) {
+            acc += factors[c] * datas[c][i];
+        }
+        x[i] = acc;
+    }
+
+    acc = 0.0;
+    for (k=0; k<na; k++) {
+        acc += amplitudes[k];
+        cumamp[k] = acc;
+    }
+
+    for (j=0; j<nd+na-1; j++) {
+        y[j] = 0.0;
+    }
+
+    /* one shifted, scaled copy of the trace per STF sample, the inner loop
+     * has no dependencies and vectorizes well */
+    for (k=0; k<na; k++) {
+        a = amplitudes[k];
+        for (i=0; i<nd; i++) {
+            y[i+k] += a * x[i];
+        }
+    }
+
+    for (j=nd; j<nd+na-1; j++) {
+        y[j] += cumamp[j-nd] * x[nd-1];
+    }
+
+    for (j=0; j<nd+na-1; j++) {
+        out[j] = (float32_t)y[j];
+    }
+}
+
+static PyObject* w_combine_convolve_stf(PyObject *m, PyObject *args) {
+    PyObject *datas_seq, *factors_seq, *amplitudes_arr, *o;
+    PyObject *datas_fast, *factors_fast;
+    PyArrayObject *out_arr;
+    const float32_t *datas[MAX_COMPONENTS];
+    float64_t factors[MAX_COMPONENTS];
+    float64_t *x, *cumamp, *y;
+    npy_intp ncomponents, nd, na, shape[1];
+    npy_intp c;
+    struct module_state *st = GETSTATE(m);
+
+    if (!PyArg_ParseTuple(
+            args, "OOO", &datas_seq, &factors_seq, &amplitudes_arr)) {
+
+        PyErr_SetString(
+            st->error,
+            "usage: combine_convolve_stf(datas, factors, amplitudes)");
+        return NULL;
+    }
+
+    datas_fast = PySequence_Fast(datas_seq, "datas must be a sequence");
+    if (datas_fast == NULL) {
+        return NULL;
+    }
+
+    factors_fast = PySequence_Fast(factors_seq, "factors must be a sequence");
+    if (factors_fast == NULL) {
+        Py_DECREF(datas_fast);
+        return NULL;
+    }
+
+    ncomponents = PySequence_Fast_GET_SIZE(datas_fast);
+    if (ncomponents < 1 || ncomponents > MAX_COMPONENTS ||
+            PySequence_Fast_GET_SIZE(factors_fast) != ncomponents) {
+
+        PyErr_SetString(
+            st->error,
+            "need between 1 and 8 data arrays and one factor for each");
+        goto fail;
+    }
+
+    /* items are borrowed, datas_fast keeps the arrays alive */
+    nd = -1;
+    for (c=0; c<ncomponents; c++) {
+        o = PySequence_Fast_GET_ITEM(datas_fast, c);
+        if (!good_array(o, NPY_FLOAT32, nd, 1, NULL)) {
+            goto fail;
+        }
+        nd = PyArray_SIZE((PyArrayObject*)o);
+        datas[c] = PyArray_DATA((PyArrayObject*)o);
+
+        factors[c] = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(factors_fast, c));
+        if (factors[c] == -1.0 && PyErr_Occurred()) {
+            goto fail;
+        }
+    }
+
+    if (!good_array(amplitudes_arr, NPY_FLOAT64, -1, 1, NULL)) {
+        goto fail;
+    }
+
+    na = PyArray_SIZE((PyArrayObject*)amplitudes_arr);
+
+    if (nd < 1 || na < 1) {
+        PyErr_SetString(st->error, "data and amplitudes must not be empty");
+        goto fail;
+    }
+
+    shape[0] = nd + na - 1;
+    out_arr = (PyArrayObject*)PyArray_EMPTY(1, shape, NPY_FLOAT32, 0);
+    x = (float64_t*)malloc(sizeof(float64_t) * nd);
+    cumamp = (float64_t*)malloc(sizeof(float64_t) * na);
+    y = (float64_t*)malloc(sizeof(float64_t) * shape[0]);
+
+    if (out_arr == NULL || x == NULL || cumamp == NULL || y == NULL) {
+        Py_XDECREF(out_arr);
+        free(x);
+        free(cumamp);
+        free(y);
+        PyErr_SetString(st->error, "cannot allocate memory");
+        goto fail;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    combine_convolve_stf(
+        ncomponents, datas, factors, nd,
+        PyArray_DATA((PyArrayObject*)amplitudes_arr), na,
+        x, cumamp, y,
+        PyArray_DATA(out_arr));
+    Py_END_ALLOW_THREADS
+
+    free(x);
+    free(cumamp);
+    free(y);
+    Py_DECREF(datas_fast);
+    Py_DECREF(factors_fast);
+
+    return (PyObject*)out_arr;
+
+fail:
+    Py_DECREF(datas_fast);
+    Py_DECREF(factors_fast);
+    return NULL;
+}
+
+static PyMethodDef post_process_ext_methods[] = {
+    {"combine_convolve_stf", (PyCFunction) w_combine_convolve_stf, METH_VARARGS,
+        "Combine weighted components and convolve with padded STF." },
+
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+#if PY_MAJOR_VERSION >= 3
+
+static int post_process_ext_traverse(PyObject *m, visitproc visit, void *arg) {
+    Py_VISIT(GETSTATE(m)->error);
+    return 0;
+}
+
+static int post_process_ext_clear(PyObject *m) {
+    Py_CLEAR(GETSTATE(m)->error);
+    return 0;
+}
+
+
+static struct PyModuleDef moduledef = {
+        PyModuleDef_HEAD_INIT,
+        "post_process_ext",
+        NULL,
+        sizeof(struct module_state),
+        post_process_ext_methods,
+        NULL,
+        post_process_ext_traverse,
+        post_process_ext_clear,
+        NULL
+};
+
+#define INITERROR return NULL
+
+PyMODINIT_FUNC
+PyInit_post_process_ext(void)
+
+#else
+#define INITERROR return
+
+void
+initpost_process_ext(void)
+#endif
+
+{
+#if PY_MAJOR_VERSION >= 3
+    PyObject *module = PyModule_Create(&moduledef);
+#else
+    PyObject *module = Py_InitModule("post_process_ext", post_process_ext_methods);
+#endif
+    import_array();
+
+    if (module == NULL)
+        INITERROR;
+    struct module_state *st = GETSTATE(module);
+
+    st->error = PyErr_NewException("pyrocko.gf.post_process_ext.PostProcessExtError", NULL, NULL);
+    if (st->error == NULL) {
+        Py_DECREF(module);
+        INITERROR;
+    }
+
+    Py_INCREF(st->error);
+    PyModule_AddObject(module, "PostProcessExtError", st->error);
+
+#if PY_MAJOR_VERSION >= 3
+    return module;
+#endif
+}
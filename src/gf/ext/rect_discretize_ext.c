@@ -0,0 +1,306 @@
+#define NPY_NO_DEPRECATED_API 7
+
+#include "Python.h"
+#include "numpy/arrayobject.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+
+struct module_state {
+    PyObject *error;
+};
+
+#if PY_MAJOR_VERSION >= 3
+#define GETSTATE(m) ((struct module_state*)PyModule_GetState(m))
+#else
+#define GETSTATE(m) (&_state); (void) m;
+static struct module_state _state;
+#endif
+
+typedef npy_float64 float64_t;
+
+int good_array(PyObject* o, int typenum, npy_intp size_want, int ndim_want, npy_intp* shape_want) {
+    int i;
+
+    if (!PyArray_Check(o)) {
+        PyErr_SetString(PyExc_AttributeError, "not a NumPy array" );
+        return 0;
+    }
+
+    if (PyArray_TYPE((PyArrayObject*)o) != typenum) {
+        PyErr_SetString(PyExc_AttributeError, "array of unexpected type");
+        return 0;
+    }
+
+    if (!PyArray_ISCARRAY((PyArrayObject*)o)) {
+        PyErr_SetString(PyExc_AttributeError, "array is not contiguous or not well behaved");
+        return 0;
+    }
+
+    if (size_want != -1 && size_want != PyArray_SIZE((PyArrayObject*)o)) {
+        PyErr_SetString(PyExc_AttributeError, "array is of unexpected size");
+        return 0;
+    }
+
+    if (ndim_want != -1 && ndim_want != PyArray_NDIM((PyArrayObject*)o)) {
+        PyErr_SetString(PyExc_AttributeError, "array is of unexpected ndim");
+        return 0;
+    }
+
+    if (ndim_want != -1 && shape_want != NULL) {
+        for (i=0; i<ndim_want; i++) {
+            if (shape_want[i] != -1 && shape_want[i] != PyArray_DIMS((PyArrayObject*)o)[i]) {
+                PyErr_SetString(PyExc_AttributeError, "array is of unexpected shape");
+                return 0;
+            }
+        }
+    }
+    return 1;
+}
+
+static void discretize_rect_source(
+        const float64_t *rotmat,
+        size_t nl,
+        size_t nw,
+        float64_t length,
+        float64_t width,
+        float64_t anch_x,
+        float64_t anch_y,
+        int have_nucleation_x,
+        float64_t nucleation_x,
+        int have_nucleation_y,
+        float64_t nucleation_y,
+        float64_t velocity,
+        const float64_t *xtau,
+        const float64_t *amplitudes,
+        size_t nt,
+        float64_t north,
+        float64_t east,
+        float64_t depth,
+        float64_t *points2,
+        float64_t *times2,
+        float64_t *amplitudes2) {
+
+    /*
+     * Sub-source positions on the fault plane (x along strike, y down dip),
+     * rupture onset times from the nucleation point, anchor shift and
+     * rotation into (north, east, down) in a single pass. Each sub-source
+     * is repeated for each of the nt STF samples.
+     */
+
+    size_t il, iw, it, i, j;
+    float64_t dl, dw, x, y, xa, ya, x0, y0, dx, dy, t, pn, pe, pd;
+
+    dl = length / nl;
+    dw = width / nw;
+
+    x0 = -0.5 * (length - dl);
+    y0 = -0.5 * (width - dw);
+
+    for (iw=0; iw<nw; iw++) {
+        y = y0 + iw * dw;
+        dy = have_nucleation_y ? fabs(nucleation_y - y) : 0.0;
+        ya = y - anch_y * 0.5 * width;
+        for (il=0; il<nl; il++) {
+            x = x0 + il * dl;
+            dx = have_nucleation_x ? fabs(nucleation_x - x) : 0.0;
+            t = sqrt(dx*dx + dy*dy) / velocity;
+
+            xa = x - anch_x * 0.5 * length;
+
+            /* p' = R^T p, with p = (xa, ya, 0) */
+            pn = rotmat[0*3+0] * xa + rotmat[1*3+0] * ya + north;
+            pe = rotmat[0*3+1] * xa + rotmat[1*3+1] * ya + east;
+            pd = rotmat[0*3+2] * xa + rotmat[1*3+2] * ya + depth;
+
+            i = (iw*nl + il) * nt;
+            for (it=0; it<nt; it++) {
+                j = i + it;
+                points2[j*3+0] = pn;
+                points2[j*3+1] = pe;
+                points2[j*3+2] = pd;
+                times2[j] = t + xtau[it];
+                amplitudes2[j] = amplitudes[it];
+            }
+        }
+    }
+}
+
+static int get_optional_float(PyObject *o, int *have, float64_t *value) {
+    if (o == Py_None) {
+        *have = 0;
+        *value = 0.0;
+        return 1;
+    }
+
+    *value = PyFloat_AsDouble(o);
+    if (*value == -1.0 && PyErr_Occurred()) {
+        return 0;
+    }
+    *have = 1;
+    return 1;
+}
+
+static PyObject* w_discretize_rect_source(PyObject *m, PyObject *args) {
+    PyObject *rotmat_arr, *xtau_arr, *amplitudes_arr;
+    PyObject *nucleation_x_obj, *nucleation_y_obj;
+    PyArrayObject *points2_arr, *times2_arr, *amplitudes2_arr;
+    unsigned long nl, nw;
+    int have_nucleation_x, have_nucleation_y;
+    float64_t length, width, anch_x, anch_y, nucleation_x, nucleation_y;
+    float64_t velocity, north, east, depth;
+    npy_intp shape[2], nt, n;
+    npy_intp shape_rotmat[2] = {3, 3};
+    struct module_state *st = GETSTATE(m);
+
+    if (!PyArg_ParseTuple(
+            args, "OkkddddOOdOOddd",
+            &rotmat_arr, &nl, &nw, &length, &width, &anch_x, &anch_y,
+            &nucleation_x_obj, &nucleation_y_obj, &velocity,
+            &xtau_arr, &amplitudes_arr, &north, &east, &depth)) {
+
+        PyErr_SetString(
+            st->error,
+            "usage: discretize_rect_source(rotmat, nl, nw, length, width, "
+            "anch_x, anch_y, nucleation_x, nucleation_y, velocity, xtau, "
+            "amplitudes, north, east, depth)");
+        return NULL;
+    }
+
+    if (!good_array(rotmat_arr, NPY_FLOAT64, 9, 2, shape_rotmat)) {
+        return NULL;
+    }
+
+    if (!good_array(xtau_arr, NPY_FLOAT64, -1, 1, NULL)) {
+        return NULL;
+    }
+
+    nt = PyArray_SIZE((PyArrayObject*)xtau_arr);
+
+    if (!good_array(amplitudes_arr, NPY_FLOAT64, nt, 1, NULL)) {
+        return NULL;
+    }
+
+    if (nl == 0 || nw == 0) {
+        PyErr_SetString(st->error, "nl and nw must be positive");
+        return NULL;
+    }
+
+    if (!get_optional_float(
+            nucleation_x_obj, &have_nucleation_x, &nucleation_x)) {
+        return NULL;
+    }
+
+    if (!get_optional_float(
+            nucleation_y_obj, &have_nucleation_y, &nucleation_y)) {
+        return NULL;
+    }
+
+    n = (npy_intp)nl * (npy_intp)nw * nt;
+
+    shape[0] = n;
+    shape[1] = 3;
+    points2_arr = (PyArrayObject*)PyArray_EMPTY(2, shape, NPY_FLOAT64, 0);
+    times2_arr = (PyArrayObject*)PyArray_EMPTY(1, shape, NPY_FLOAT64, 0);
+    amplitudes2_arr = (PyArrayObject*)PyArray_EMPTY(1, shape, NPY_FLOAT64, 0);
+
+    if (points2_arr == NULL || times2_arr == NULL || amplitudes2_arr == NULL) {
+        Py_XDECREF(points2_arr);
+        Py_XDECREF(times2_arr);
+        Py_XDECREF(amplitudes2_arr);
+        PyErr_SetString(st->error, "cannot allocate output arrays");
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    discretize_rect_source(
+        PyArray_DATA((PyArrayObject*)rotmat_arr),
+        nl, nw, length, width, anch_x, anch_y,
+        have_nucleation_x, nucleation_x,
+        have_nucleation_y, nucleation_y,
+        velocity,
+        PyArray_DATA((PyArrayObject*)xtau_arr),
+        PyArray_DATA((PyArrayObject*)amplitudes_arr),
+        nt, north, east, depth,
+        PyArray_DATA(points2_arr),
+        PyArray_DATA(times2_arr),
+        PyArray_DATA(amplitudes2_arr));
+    Py_END_ALLOW_THREADS
+
+    return Py_BuildValue(
+        "NNN",
+        (PyObject*)points2_arr,
+        (PyObject*)times2_arr,
+        (PyObject*)amplitudes2_arr);
+}
+
+static PyMethodDef rect_discretize_ext_methods[] = {
+    {"discretize_rect_source", (PyCFunction) w_discretize_rect_source, METH_VARARGS,
+        "Discretize rectangular source into point sources in space and time." },
+
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+#if PY_MAJOR_VERSION >= 3
+
+static int rect_discretize_ext_traverse(PyObject *m, visitproc visit, void *arg) {
+    Py_VISIT(GETSTATE(m)->error);
+    return 0;
+}
+
+static int rect_discretize_ext_clear(PyObject *m) {
+    Py_CLEAR(GETSTATE(m)->error);
+    return 0;
+}
+
+
+static struct PyModuleDef moduledef = {
+        PyModuleDef_HEAD_INIT,
+        "rect_discretize_ext",
+        NULL,
+        sizeof(struct module_state),
+        rect_discretize_ext_methods,
+        NULL,
+        rect_discretize_ext_traverse,
+        rect_discretize_ext_clear,
+        NULL
+};
+
+#define INITERROR return NULL
+
+PyMODINIT_FUNC
+PyInit_rect_discretize_ext(void)
+
+#else
+#define INITERROR return
+
+void
+initrect_discretize_ext(void)
+#endif
+
+{
+#if PY_MAJOR_VERSION >= 3
+    PyObject *module = PyModule_Create(&moduledef);
+#else
+    PyObject *module = Py_InitModule("rect_discretize_ext", rect_discretize_ext_methods);
+#endif
+    import_array();
+
+    if (module == NULL)
+        INITERROR;
+    struct module_state *st = GETSTATE(module);
+
+    st->error = PyErr_NewException("pyrocko.gf.rect_discretize_ext.RectDiscretizeExtError", NULL, NULL);
+    if (st->error == NULL) {
+        Py_DECREF(module);
+        INITERROR;
+    }
+
+    Py_INCREF(st->error);
+    PyModule_AddObject(module, "RectDiscretizeExtError", st->error);
+
+#if PY_MAJOR_VERSION >= 3
+    return module;
+#endif
+}
@@ -60,7 +60,7 @@ class SeismosizerTrace(Object):
         dtype=num.float32,
         serialize_as='base64',
         serialize_dtype=num.dtype('<f4'),
-        help='numpy array with data samples')
+        help='numpy array with data samples (float32)')
 
     deltat = Float.T(
         default=1.0,
@@ -1898,7 +1898,14 @@ class Config(Object):
                 'parameter %s not available' % parameter)
 
         if interpolation == 'multilinear':
-            kind = 'linear'
+            # depth profile is sorted, no need to set up an interp1d object
+            depths = points[:, 2]
+            if num.any(depths < store_depth_profile[0]) \
+                    or num.any(depths > store_depth_profile[-1]):
+                raise OutOfBounds()
+
+            return num.interp(depths, store_depth_profile, profile)
+
         elif interpolation == 'nearest_neighbor':
             kind = 'nearest'
         else:
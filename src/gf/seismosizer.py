@@ -5,7 +5,6 @@
 from __future__ import absolute_import, division, print_function
 
 from collections import defaultdict
-from functools import cmp_to_key
 import time
 import math
 import os
@@ -14,6 +13,7 @@ import logging
 import resource
 
 import numpy as num
+from scipy import signal
 
 from pyrocko.guts import (Object, Float, String, StringChoice, List,
                           Timestamp, Int, SObject, ArgumentError, Dict,
@@ -37,30 +37,6 @@ d2r = math.pi / 180.
 logger = logging.getLogger('pyrocko.gf.seismosizer')
 
 
-def cmp_none_aware(a, b):
-    if isinstance(a, tuple) and isinstance(b, tuple):
-        for xa, xb in zip(a, b):
-            rv = cmp_none_aware(xa, xb)
-            if rv != 0:
-                return rv
-
-        return 0
-
-    anone = a is None
-    bnone = b is None
-
-    if anone and bnone:
-        return 0
-
-    if anone:
-        return -1
-
-    if bnone:
-        return 1
-
-    return bool(a > b) - bool(a < b)
-
-
 def xtime():
     return time.time()
 
@@ -137,6 +113,55 @@ def nonzero(x, eps=1e-15):
     return abs(x) > eps
 
 
+def convolve_stf(amplitudes, data):
+    '''
+    Full discrete convolution of STF amplitudes with a trace.
+
+    Direct convolution is faster for the short STFs which are common in
+    practice, FFT-based convolution pays off for long ones.
+    '''
+
+    if amplitudes.size >= 512:
+        return signal.fftconvolve(amplitudes, data)
+    else:
+        return num.convolve(amplitudes, data)
+
+
+def combine_convolve_stf(datas, factors, amplitudes, implementation='c'):
+    '''
+    Weighted sum of component traces, convolved with STF amplitudes.
+
+    The combined trace is padded with its last sample to prevent boundary
+    effects and the result is truncated to ``len(data) + len(amplitudes) - 1``
+    samples. The C implementation is used for short STFs, longer ones are
+    handed to :py:func:`convolve_stf`, which makes better use of the CPU's
+    vector units. Both accumulate in double precision and return the result
+    in the sample type of the GF stores. The C implementation takes traces in
+    that sample type only; traces of higher precision, e.g. differentiated
+    ones, are not rounded but go through the NumPy implementation.
+    '''
+
+    amplitudes = num.ascontiguousarray(amplitudes, dtype=num.float64)
+
+    if implementation == 'c' and amplitudes.size < 100 and all(
+            d.dtype == store.gf_dtype for d in datas):
+
+        from . import post_process_ext
+        return post_process_ext.combine_convolve_stf(
+            [num.ascontiguousarray(d) for d in datas],
+            factors,
+            amplitudes)
+
+    n = datas[0].size
+    padded_data = num.zeros(n + amplitudes.size, dtype=num.float64)
+    for d, factor in zip(datas, factors):
+        padded_data[:n] += num.asarray(d, dtype=num.float64) * factor
+
+    padded_data[n:] = padded_data[n-1]
+    return convolve_stf(amplitudes, padded_data)[:-amplitudes.size].astype(
+        store.gf_dtype)
+
+
 def permudef(ln, j=0):
     if j < len(ln):
         k, v = ln[j]
@@ -155,11 +180,29 @@ def arr(x):
     return num.atleast_1d(num.asarray(x))
 
 
+_rotmat_cache = {}
+
+
+def _euler_to_matrix_cached(dip, strike):
+    k = (dip, strike)
+    if k not in _rotmat_cache:
+        if len(_rotmat_cache) >= 256:
+            _rotmat_cache.clear()
+
+        rotmat = num.array(pmt.euler_to_matrix(dip * d2r, strike * d2r, 0.0))
+        rotmat.flags.writeable = False
+        _rotmat_cache[k] = rotmat
+
+    return _rotmat_cache[k]
+
+
 def discretize_rect_source(deltas, deltat, time, north, east, depth,
                            strike, dip, length, width,
                            anchor, velocity, stf=None,
                            nucleation_x=None, nucleation_y=None,
-                           decimation_factor=1):
+                           decimation_factor=1, implementation='c'):
+
+    assert implementation in ('c', 'python')
 
     if stf is None:
         stf = STF()
@@ -178,6 +221,27 @@ def discretize_rect_source(deltas, deltat, time, north, east, depth,
     dl = ln / nl
     dw = wd / nw
 
+    anch_x, anch_y = map_anchor[anchor]
+
+    rotmat = num.asarray(
+        pmt.euler_to_matrix(dip * d2r, strike * d2r, 0.0))
+
+    xtau, amplitudes = stf.discretize_t(deltat, time)
+
+    if implementation == 'c':
+        from . import rect_discretize_ext
+        points2, times2, amplitudes2 = \
+            rect_discretize_ext.discretize_rect_source(
+                num.ascontiguousarray(rotmat, dtype=num.float64),
+                nl, nw, float(ln), float(wd),
+                float(anch_x), float(anch_y),
+                nucleation_x, nucleation_y, float(velocity),
+                num.ascontiguousarray(xtau, dtype=num.float64),
+                num.ascontiguousarray(amplitudes, dtype=num.float64),
+                float(north), float(east), float(depth))
+
+        return points2, times2, amplitudes2, dl, dw, nl, nw
+
     xl = num.linspace(-0.5 * (ln - dl), 0.5 * (ln - dl), nl)
     xw = num.linspace(-0.5 * (wd - dw), 0.5 * (wd - dw), nw)
 
@@ -199,17 +263,11 @@ def discretize_rect_source(deltas, deltat, time, north, east, depth,
     dist = num.sqrt(dist_x**2 + dist_y**2)
     times = dist / velocity
 
-    anch_x, anch_y = map_anchor[anchor]
-
     points[:, 0] -= anch_x * 0.5 * length
     points[:, 1] -= anch_y * 0.5 * width
 
-    rotmat = num.asarray(
-        pmt.euler_to_matrix(dip * d2r, strike * d2r, 0.0))
-
     points = num.dot(rotmat.T, points.T).T
 
-    xtau, amplitudes = stf.discretize_t(deltat, time)
     nt = xtau.size
 
     points2 = num.repeat(points, nt, axis=0)
@@ -2481,13 +2539,14 @@ class RingfaultSource(SourceWithMagnitude):
     def discretize_basesource(self, store=None, target=None):
         n = self.npointsources
         phi = num.linspace(0, 2.0 * num.pi, n, endpoint=False)
+        cos_phi = num.cos(phi)
+        sin_phi = num.sin(phi)
 
         points = num.zeros((n, 3))
-        points[:, 0] = num.cos(phi) * 0.5 * self.diameter
-        points[:, 1] = num.sin(phi) * 0.5 * self.diameter
+        points[:, 0] = cos_phi * 0.5 * self.diameter
+        points[:, 1] = sin_phi * 0.5 * self.diameter
 
-        rotmat = num.array(pmt.euler_to_matrix(
-            self.dip * d2r, self.strike * d2r, 0.0))
+        rotmat = _euler_to_matrix_cached(self.dip, self.strike)
         points = num.dot(rotmat.T, points.T).T  # !!! ?
 
         points[:, 0] += self.north_shift
@@ -2498,8 +2557,8 @@ class RingfaultSource(SourceWithMagnitude):
                                        scalar_moment=1.0 / n).m())
 
         rotmats = num.transpose(
-            [[num.cos(phi), num.sin(phi), num.zeros(n)],
-             [-num.sin(phi), num.cos(phi), num.zeros(n)],
+            [[cos_phi, sin_phi, num.zeros(n)],
+             [-sin_phi, cos_phi, num.zeros(n)],
              [num.zeros(n), num.zeros(n), num.ones(n)]], (2, 0, 1))
 
         ms = num.zeros((n, 3, 3))
@@ -2507,14 +2566,16 @@ class RingfaultSource(SourceWithMagnitude):
             mtemp = num.dot(rotmats[i].T, num.dot(m, rotmats[i]))
             ms[i, :, :] = num.dot(rotmat.T, num.dot(mtemp, rotmat))
 
-        m6s = num.vstack((ms[:, 0, 0], ms[:, 1, 1], ms[:, 2, 2],
-                          ms[:, 0, 1], ms[:, 0, 2], ms[:, 1, 2])).T
+        m6s = ms[:, [0, 1, 2, 0, 0, 1], [0, 1, 2, 1, 2, 2]]
 
         times, amplitudes = self.effective_stf_pre().discretize_t(
             store.config.deltat, self.time)
 
         nt = times.size
 
+        m6s = num.repeat(m6s, nt, axis=0)
+        m6s *= num.tile(amplitudes, n)[:, num.newaxis]
+
         return meta.DiscretizedMTSource(
             times=num.tile(times, n),
             lat=self.lat,
@@ -2522,8 +2583,7 @@ class RingfaultSource(SourceWithMagnitude):
             north_shifts=num.repeat(points[:, 0], nt),
             east_shifts=num.repeat(points[:, 1], nt),
             depths=num.repeat(points[:, 2], nt),
-            m6s=num.repeat(m6s, nt, axis=0) * num.tile(
-                amplitudes, n)[:, num.newaxis])
+            m6s=m6s)
 
 
 class CombiSource(Source):
@@ -2778,13 +2838,17 @@ class Request(Object):
 
         return m
 
-    def subrequest_map(self):
+    def iter_subrequests(self):
         ms = self.subsources_map()
         mt = self.subtargets_map()
-        m = {}
         for (ks, ls) in ms.items():
             for (kt, lt) in mt.items():
-                m[ks, kt] = (ls, lt)
+                yield ks, kt, ls, lt
+
+    def subrequest_map(self):
+        m = {}
+        for (ks, kt, ls, lt) in self.iter_subrequests():
+            m[ks, kt] = (ls, lt)
 
         return m
 
@@ -2871,9 +2935,8 @@ class Response(Object):
         :class:`~pyrocko.trace.Trace` instances in each iteration.
         '''
 
-        for isource, source in enumerate(self.request.sources):
-            for itarget, target in enumerate(self.request.targets):
-                result = self.results_list[isource][itarget]
+        for source, results in zip(self.request.sources, self.results_list):
+            for target, result in zip(self.request.targets, results):
                 if get == 'pyrocko_traces':
                     yield source, target, result.trace.pyrocko_trace()
                 elif get == 'results':
@@ -2901,7 +2964,8 @@ class Engine(Object):
 
 
 class Rule(object):
-    pass
+    differentiate = 0
+    integrate = 0
 
 
 class VectorRule(Rule):
@@ -2911,39 +2975,28 @@ class VectorRule(Rule):
         self.differentiate = differentiate
         self.integrate = integrate
 
-    def required_components(self, target):
+    def component_factors(self, target):
         n, e, d = self.components
         sa, ca, sd, cd = target.get_sin_cos_factors()
 
-        comps = []
-        if nonzero(ca * cd):
-            comps.append(n)
-
-        if nonzero(sa * cd):
-            comps.append(e)
+        return [
+            (c, factor) for (c, factor) in (
+                (n, ca * cd), (e, sa * cd), (d, sd))
+            if nonzero(factor)]
 
-        if nonzero(sd):
-            comps.append(d)
-
-        return tuple(comps)
+    def required_components(self, target):
+        return tuple(c for (c, _) in self.component_factors(target))
 
     def apply_(self, target, base_seismogram):
-        n, e, d = self.components
-        sa, ca, sd, cd = target.get_sin_cos_factors()
-
-        if nonzero(ca * cd):
-            data = base_seismogram[n].data * (ca * cd)
-            deltat = base_seismogram[n].deltat
-        else:
-            data = 0.0
-
-        if nonzero(sa * cd):
-            data = data + base_seismogram[e].data * (sa * cd)
-            deltat = base_seismogram[e].deltat
+        data = None
+        for c, factor in self.component_factors(target):
+            tr = base_seismogram[c]
+            if data is None:
+                data = tr.data * factor
+            else:
+                data += tr.data * factor
 
-        if nonzero(sd):
-            data = data + base_seismogram[d].data * sd
-            deltat = base_seismogram[d].deltat
+            deltat = tr.deltat
 
         if self.differentiate:
             data = util.diff_fd(self.differentiate, 4, deltat, data)
@@ -2961,33 +3014,29 @@ class HorizontalVectorRule(Rule):
         self.differentiate = differentiate
         self.integrate = integrate
 
-    def required_components(self, target):
+    def component_factors(self, target):
         n, e = self.components
         sa, ca, _, _ = target.get_sin_cos_factors()
 
-        comps = []
-        if nonzero(ca):
-            comps.append(n)
+        return [
+            (c, factor) for (c, factor) in ((n, ca), (e, sa))
+            if nonzero(factor)]
 
-        if nonzero(sa):
-            comps.append(e)
-
-        return tuple(comps)
+    def required_components(self, target):
+        return tuple(c for (c, _) in self.component_factors(target))
 
     def apply_(self, target, base_seismogram):
-        n, e = self.components
-        sa, ca, _, _ = target.get_sin_cos_factors()
-
-        if nonzero(ca):
-            data = base_seismogram[n].data * ca
-        else:
-            data = 0.0
+        data = None
+        for c, factor in self.component_factors(target):
+            tr = base_seismogram[c]
+            if data is None:
+                data = tr.data * factor
+            else:
+                data += tr.data * factor
 
-        if nonzero(sa):
-            data = data + base_seismogram[e].data * sa
+            deltat = tr.deltat
 
         if self.differentiate:
-            deltat = base_seismogram[e].deltat
             data = util.diff_fd(self.differentiate, 4, deltat, data)
 
         if self.integrate:
@@ -3000,12 +3049,17 @@ class ScalarRule(Rule):
 
     def __init__(self, quantity, differentiate=0):
         self.c = quantity
+        self.differentiate = differentiate
+
+    def component_factors(self, target):
+        return [(self.c, 1.0)]
 
     def required_components(self, target):
         return (self.c, )
 
     def apply_(self, target, base_seismogram):
-        data = base_seismogram[self.c].data.copy()
+        # not a copy, _post_process_dynamic does not modify data in place
+        data = base_seismogram[self.c].data
         deltat = base_seismogram[self.c].deltat
         if self.differentiate:
             data = util.diff_fd(self.differentiate, 4, deltat, data)
@@ -3057,6 +3111,8 @@ class OutOfBoundsContext(Object):
 
 def process_dynamic_timeseries(work, psources, ptargets, engine, nthreads=0):
     dsource_cache = {}
+    target_cache = {}
+    rule_cache = {}
     tcounters = list(range(6))
 
     store_ids = set()
@@ -3078,7 +3134,7 @@ def process_dynamic_timeseries(work, psources, ptargets, engine, nthreads=0):
 
         components = set()
         for itarget, target in enumerate(targets):
-            rule = engine.get_rule(source, target)
+            rule = engine._cached_rule(source, target, rule_cache)
             components.update(rule.required_components(target))
 
         for store_id in store_ids:
@@ -3106,7 +3162,8 @@ def process_dynamic_timeseries(work, psources, ptargets, engine, nthreads=0):
                         engine_targets,
                         components,
                         dsource_cache,
-                        nthreads)
+                        nthreads,
+                        target_cache=target_cache)
 
             for iseis, seismogram in enumerate(base_seismograms):
                 for tr in seismogram.values():
@@ -3126,7 +3183,7 @@ def process_dynamic_timeseries(work, psources, ptargets, engine, nthreads=0):
 
                 try:
                     result = engine._post_process_dynamic(
-                            seismogram, source, target)
+                            seismogram, source, target, rule_cache)
                 except SeismosizerError as e:
                     result = e
 
@@ -3135,6 +3192,8 @@ def process_dynamic_timeseries(work, psources, ptargets, engine, nthreads=0):
 
 def process_dynamic(work, psources, ptargets, engine, nthreads=0):
     dsource_cache = {}
+    target_cache = {}
+    rule_cache = {}
 
     for w in work:
         _, _, isources, itargets = w
@@ -3144,7 +3203,7 @@ def process_dynamic(work, psources, ptargets, engine, nthreads=0):
 
         components = set()
         for target in targets:
-            rule = engine.get_rule(sources[0], target)
+            rule = engine._cached_rule(sources[0], target, rule_cache)
             components.update(rule.required_components(target))
 
         for isource, source in zip(isources, sources):
@@ -3152,7 +3211,8 @@ def process_dynamic(work, psources, ptargets, engine, nthreads=0):
 
                 try:
                     base_seismogram, tcounters = engine.base_seismogram(
-                        source, target, components, dsource_cache, nthreads)
+                        source, target, components, dsource_cache, nthreads,
+                        target_cache=target_cache)
                 except meta.OutOfBounds as e:
                     e.context = OutOfBoundsContext(
                         source=sources[0],
@@ -3172,7 +3232,7 @@ def process_dynamic(work, psources, ptargets, engine, nthreads=0):
 
                 try:
                     result = engine._post_process_dynamic(
-                        base_seismogram, source, target)
+                        base_seismogram, source, target, rule_cache)
                     result.n_records_stacked = n_records_stacked
                     result.n_shared_stacking = len(sources) *\
                         len(targets)
@@ -3416,14 +3476,45 @@ class LocalEngine(Engine):
                 target.store_id,
                 source.__class__.__name__))
 
+    def _cached_rule(self, source, target, cache):
+        if cache is not None and target in cache:
+            return cache[target]
+
+        rule = self.get_rule(source, target)
+
+        if cache is not None:
+            cache[target] = rule
+
+        return rule
+
     def _cached_discretize_basesource(self, source, store, cache, target):
         if (source, store) not in cache:
             cache[source, store] = source.discretize_basesource(store, target)
 
         return cache[source, store]
 
+    def _cached_target_meta(self, target, store_, cache):
+        if cache is not None and target in cache:
+            return cache[target]
+
+        receiver = target.receiver(store_)
+
+        if target.tmin and target.tmax is not None:
+            rate = store_.config.sample_rate
+            itmin = int(num.floor(target.tmin * rate))
+            itmax = int(num.ceil(target.tmax * rate))
+            nsamples = itmax - itmin + 1
+        else:
+            itmin = None
+            nsamples = None
+
+        if cache is not None:
+            cache[target] = receiver, itmin, nsamples
+
+        return receiver, itmin, nsamples
+
     def base_seismograms(self, source, targets, components, dsource_cache,
-                         nthreads=0):
+                         nthreads=0, target_cache=None):
 
         target = targets[0]
 
@@ -3436,7 +3527,9 @@ class LocalEngine(Engine):
             raise BadRequest('Targets have different sample rates.')
 
         store_ = self.get_store(target.store_id)
-        receivers = [t.receiver(store_) for t in targets]
+        receivers = [
+            self._cached_target_meta(t, store_, target_cache)[0]
+            for t in targets]
 
         if target.sample_rate is not None:
             deltat = 1. / target.sample_rate
@@ -3458,13 +3551,24 @@ class LocalEngine(Engine):
         itmin[mask] = 0
         nsamples[mask] = -1
 
+        # targets at the same position and with the same time window, e.g.
+        # the different components of a station, share a base seismogram
+        ireceivers = {}
+        iunique = []
+        for receiver, itmin_, nsamples_ in zip(receivers, itmin, nsamples):
+            k = (tuple(receiver.coords5), itmin_, nsamples_)
+            iunique.append(ireceivers.setdefault(k, len(ireceivers)))
+
+        iunique = num.array(iunique, dtype=num.int64)
+        ifirst = num.unique(iunique, return_index=True)[1]
+
         base_source = self._cached_discretize_basesource(
             source, store_, dsource_cache, target)
 
         base_seismograms = store_.calc_seismograms(
-            base_source, receivers, components,
+            base_source, [receivers[i] for i in ifirst], components,
             deltat=deltat,
-            itmin=itmin, nsamples=nsamples,
+            itmin=itmin[ifirst], nsamples=nsamples[ifirst],
             interpolation=target.interpolation,
             optimization=target.optimization,
             nthreads=nthreads)
@@ -3472,24 +3576,16 @@ class LocalEngine(Engine):
         for i, base_seismogram in enumerate(base_seismograms):
             base_seismograms[i] = store.make_same_span(base_seismogram)
 
-        return base_seismograms
+        return [base_seismograms[i] for i in iunique]
 
     def base_seismogram(self, source, target, components, dsource_cache,
-                        nthreads):
+                        nthreads, target_cache=None):
 
         tcounters = [xtime()]
 
         store_ = self.get_store(target.store_id)
-        receiver = target.receiver(store_)
-
-        if target.tmin and target.tmax is not None:
-            rate = store_.config.sample_rate
-            itmin = int(num.floor(target.tmin * rate))
-            itmax = int(num.ceil(target.tmax * rate))
-            nsamples = itmax - itmin + 1
-        else:
-            itmin = None
-            nsamples = None
+        receiver, itmin, nsamples = self._cached_target_meta(
+            target, store_, target_cache)
 
         tcounters.append(xtime())
         base_source = self._cached_discretize_basesource(
@@ -3545,34 +3641,40 @@ class LocalEngine(Engine):
 
         return base_statics, tcounters
 
-    def _post_process_dynamic(self, base_seismogram, source, target):
+    def _post_process_dynamic(self, base_seismogram, source, target,
+                              rule_cache=None):
         base_any = next(iter(base_seismogram.values()))
         deltat = base_any.deltat
         itmin = base_any.itmin
 
-        rule = self.get_rule(source, target)
-        data = rule.apply_(target, base_seismogram)
-
-        factor = source.get_factor() * target.get_factor()
-        if factor != 1.0:
-            data = data * factor
+        rule = self._cached_rule(source, target, rule_cache)
 
         stf = source.effective_stf_post()
 
         times, amplitudes = stf.discretize_t(
             deltat, 0.0)
 
-        # repeat end point to prevent boundary effects
-        padded_data = num.empty(data.size + amplitudes.size, dtype=num.float)
-        padded_data[:data.size] = data
-        padded_data[data.size:] = data[-1]
-        data = num.convolve(amplitudes, padded_data)
+        # apply factor to the (short) STF instead of the trace
+        factor = source.get_factor() * target.get_factor()
+        amplitudes = amplitudes * factor
+
+        if rule.differentiate or rule.integrate:
+            datas = [rule.apply_(target, base_seismogram)]
+            factors = [1.0]
+        else:
+            # combine components and convolve in a single pass
+            datas, factors = [], []
+            for c, f in rule.component_factors(target):
+                datas.append(base_seismogram[c].data)
+                factors.append(f)
+
+        data = combine_convolve_stf(datas, factors, amplitudes)
 
         tmin = itmin * deltat + times[0]
 
         tr = meta.SeismosizerTrace(
             codes=target.codes,
-            data=data[:-amplitudes.size],
+            data=data,
             deltat=deltat,
             tmin=tmin)
 
@@ -3602,6 +3704,9 @@ class LocalEngine(Engine):
         The request can be given a a :py:class:`Request` object, or such an
         object is created using ``Request(**kwargs)`` for convenience.
 
+        Synthetic seismogram samples are returned in the sample type of the
+        GF stores, i.e. as ``float32`` arrays.
+
         :returns: :py:class:`Response` object
         '''
 
@@ -3640,19 +3745,21 @@ class LocalEngine(Engine):
         target_index = dict((x, i) for (i, x) in
                             enumerate(request.targets))
 
-        m = request.subrequest_map()
-
-        skeys = sorted(m.keys(), key=cmp_to_key(cmp_none_aware))
-        results_list = []
+        subrequests = [
+            (ls, lt) for (_, _, ls, lt) in request.iter_subrequests()]
 
-        for i in range(len(request.sources)):
-            results_list.append([None] * len(request.targets))
+        ntargets = len(request.targets)
+        results_list = [[None] * ntargets for _ in request.sources]
 
         tcounters_dyn_list = []
         tcounters_static_list = []
-        nsub = len(skeys)
+        nsub = len(subrequests)
         isub = 0
 
+        n_records_stacked = 0.
+        t_optimize = 0.
+        t_stack = 0.
+
         # Processing dynamic targets through
         # parimap(process_subrequest_dynamic)
 
@@ -3664,10 +3771,10 @@ class LocalEngine(Engine):
         if request.has_dynamic:
             work_dynamic = [
                 (i, nsub,
-                 [source_index[source] for source in m[k][0]],
-                 [target_index[target] for target in m[k][1]
+                 [source_index[source] for source in ls],
+                 [target_index[target] for target in lt
                   if not isinstance(target, StaticTarget)])
-                for (i, k) in enumerate(skeys)]
+                for (i, (ls, lt)) in enumerate(subrequests)]
 
             for ii_results, tcounters_dyn in _process_dynamic(
                     work_dynamic, request.sources, request.targets, self,
@@ -3677,6 +3784,12 @@ class LocalEngine(Engine):
                 isource, itarget, result = ii_results
                 results_list[isource][itarget] = result
 
+                if isinstance(result, meta.Result):
+                    shr = float(result.n_shared_stacking)
+                    n_records_stacked += result.n_records_stacked / shr
+                    t_optimize += result.t_optimize / shr
+                    t_stack += result.t_stack / shr
+
                 if status_callback:
                     status_callback(isub, nsub)
 
@@ -3686,10 +3799,10 @@ class LocalEngine(Engine):
         if request.has_statics:
             work_static = [
                 (i, nsub,
-                 [source_index[source] for source in m[k][0]],
-                 [target_index[target] for target in m[k][1]
+                 [source_index[source] for source in ls],
+                 [target_index[target] for target in lt
                   if isinstance(target, StaticTarget)])
-                for (i, k) in enumerate(skeys)]
+                for (i, (ls, lt)) in enumerate(subrequests)]
 
             for ii_results, tcounters_static in process_static(
                     work_static, request.sources, request.targets, self,
@@ -3742,16 +3855,9 @@ class LocalEngine(Engine):
             (rs1.ru_inblock + rc1.ru_inblock) -
             (rs0.ru_inblock + rc0.ru_inblock))
 
-        n_records_stacked = 0.
-        for results in results_list:
-            for result in results:
-                if not isinstance(result, meta.Result):
-                    continue
-                shr = float(result.n_shared_stacking)
-                n_records_stacked += result.n_records_stacked / shr
-                s.t_perc_optimize += result.t_optimize / shr
-                s.t_perc_stack += result.t_stack / shr
         s.n_records_stacked = int(n_records_stacked)
+        s.t_perc_optimize = t_optimize
+        s.t_perc_stack = t_stack
         if t_dyn != 0.:
             s.t_perc_optimize /= t_dyn * 100
             s.t_perc_stack /= t_dyn * 100
@@ -3797,7 +3903,7 @@ class SourceGroup(Object):
 
     def __getattr__(self, k):
         return num.fromiter((getattr(s, k) for s in self),
-                            dtype=num.float)
+                            dtype=num.float, count=len(self))
 
     def __iter__(self):
         raise NotImplementedError(
@@ -3840,6 +3946,22 @@ class SourceGrid(SourceGroup):
             s.regularize()
             yield s
 
+    def __getattr__(self, k):
+        # varied parameters can be assembled without creating the sources
+        variables = self.__dict__.get('variables', None)
+        base = self.__dict__.get('base', None)
+        if variables is not None and base is not None and k in variables:
+            coords = self.make_coords(base)
+            params = [param for (param, _) in coords]
+            grids = num.meshgrid(
+                *[num.asarray(values, dtype=num.float)
+                  for (_, values) in coords],
+                indexing='ij')
+
+            return grids[params.index(k)].ravel()
+
+        return SourceGroup.__getattr__(self, k)
+
     def ordered_params(self):
         ks = list(self.variables.keys())
         for k in self.order + list(self.base.keys()):
@@ -220,12 +220,16 @@ def make_same_span(tracesdict):
     itmin = min(tr.itmin for tr in nonzero)
     itmax = max(tr.itmin+tr.data.size for tr in nonzero) - 1
 
+    n = itmax - itmin + 1
+
     out = {}
     for k, tr in tracesdict.items():
-        n = itmax - itmin + 1
         if tr.itmin != itmin or tr.data.size != n:
-            data = num.zeros(n, dtype=gf_dtype)
-            if not tr.is_zero:
+            if tr.is_zero:
+                data = num.zeros(n, dtype=gf_dtype)
+            else:
+                # every sample is written below, no need to zero-fill
+                data = num.empty(n, dtype=gf_dtype)
                 lo = tr.itmin-itmin
                 hi = lo + tr.data.size
                 data[:lo] = tr.data[0]
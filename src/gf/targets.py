@@ -120,6 +120,16 @@ class Target(meta.Receiver):
         optional=True,
         help='frequency response filter.')
 
+    def __init__(self, **kwargs):
+        meta.Receiver.__init__(self, **kwargs)
+        self._sin_cos_factors = None
+
+    def __setattr__(self, name, value):
+        if name in ('azimuth', 'dip', 'codes'):
+            self.__dict__['_sin_cos_factors'] = None
+
+        meta.Receiver.__setattr__(self, name, value)
+
     def base_key(self):
         return (self.store_id, self.sample_rate, self.interpolation,
                 self.optimization,
@@ -187,13 +197,16 @@ class Target(meta.Receiver):
         raise BadTarget('cannot determine sensor component dip')
 
     def get_sin_cos_factors(self):
-        azi = self.effective_azimuth()
-        dip = self.effective_dip()
-        sa = math.sin(azi*d2r)
-        ca = math.cos(azi*d2r)
-        sd = math.sin(dip*d2r)
-        cd = math.cos(dip*d2r)
-        return sa, ca, sd, cd
+        if self._sin_cos_factors is None:
+            azi = self.effective_azimuth()
+            dip = self.effective_dip()
+            sa = math.sin(azi*d2r)
+            ca = math.cos(azi*d2r)
+            sd = math.sin(dip*d2r)
+            cd = math.cos(dip*d2r)
+            self._sin_cos_factors = sa, ca, sd, cd
+
+        return self._sin_cos_factors
 
     def get_factor(self):
         return 1.0
@@ -1788,8 +1788,10 @@ def MakePileViewerMainClass(base):
             for m in markers:
                 if m not in self.markers:
                     self.markers.append(m)
-            self.markers_added.emit(
-                len_before, len(self.markers)-1)
+
+            if len(self.markers) > len_before:
+                self.markers_added.emit(
+                    len_before, len(self.markers)-1)
 
         def remove_marker(self, marker):
             '''Remove a ``marker`` from the :py:class:`PileViewer`.
@@ -130,6 +130,7 @@ class CakePhase(Snuffling):
 
         allrays = []
         alldists = []
+        markers = []
         for station in stations:
             dist = event.distance_to(station)
             alldists.append(dist)
@@ -164,10 +165,12 @@ class CakePhase(Snuffling):
                                 event=event,
                                 incidence_angle=incidence_angle,
                                 takeoff_angle=takeoff_angle)
-                self.add_marker(m)
+                markers.append(m)
 
             allrays.extend(rays)
 
+        self.add_markers(markers)
+
         if plot_rays:
             fig = self.figure(name='Ray Paths')
             from pyrocko import cake_plot
@@ -7,7 +7,6 @@ from ..snuffling import Snuffling, Param, Choice
 from ..util import EventMarker
 
 from pyrocko.client import catalog, fdsn
-from pyrocko.io import quakeml
 
 
 class CatalogSearch(Snuffling):
@@ -78,21 +77,21 @@ class CatalogSearch(Snuffling):
             event_names = cat.get_event_names(
                 time_range=(tmin, tmax),
                 magmin=self.magmin)
-            for event_name in event_names:
-                event = cat.get_event(event_name)
-                marker = EventMarker(event)
-                self.add_markers([marker])
+            markers = [
+                EventMarker(cat.get_event(event_name))
+                for event_name in event_names]
         else:
             request = fdsn.event(
                 starttime=tmin, endtime=tmax, site=self.catalog.lower(),
                 minmagnitude=self.magmin)
 
+            from pyrocko.io import quakeml
             qml = quakeml.QuakeML.load_xml(request)
             events = qml.get_pyrocko_events()
 
-            for event in events:
-                marker = EventMarker(event)
-                self.add_markers([marker])
+            markers = [EventMarker(event) for event in events]
+
+        self.add_markers(markers)
 
 
 def __snufflings__():
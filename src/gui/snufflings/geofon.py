@@ -40,11 +40,12 @@ class GeofonEvents(Snuffling):
             time_range=(tmin, tmax),
             magmin=self._magmin)
 
-        # 2) get event information and add a marker in the snuffler window
-        for event_name in event_names:
-            event = geofon.get_event(event_name)
-            marker = EventMarker(event)
-            self.add_markers([marker])
+        # 2) get event information and add markers in the snuffler window
+        markers = [
+            EventMarker(geofon.get_event(event_name))
+            for event_name in event_names]
+
+        self.add_markers(markers)
 
 
 def __snufflings__():
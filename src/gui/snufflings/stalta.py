@@ -179,11 +179,11 @@ escidoc:4098/IS_8.1_rev1.pdf">Understanding
                 if show_level_traces:
                     self.add_trace(sumtrace)
 
-            self.add_markers(markers)
-
             if show_level_traces:
                 self.add_traces(traces)
 
+        self.add_markers(markers)
+
 
 def trace_to_pmarkers(tr, level, swin, nslc_ids=None):
     markers = []
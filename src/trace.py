@@ -3361,7 +3361,12 @@ def hilbert(x, N=None):
     '''
     Return the hilbert transform of x of length N.
 
-    (from scipy.signal, but changed to use fft and ifft from numpy.fft)
+    (equivalent to scipy.signal.hilbert along axis 0, but implemented with
+    numpy.fft)
+
+    The input is real, so only the non-negative half of the spectrum is
+    transformed: the imaginary part of the analytic signal is obtained with
+    rfft/irfft and the real part is the (zero-padded or truncated) input.
     '''
 
     x = num.asarray(x)
@@ -3372,19 +3377,21 @@ def hilbert(x, N=None):
     if num.iscomplexobj(x):
         logger.warning('imaginary part of x ignored.')
         x = num.real(x)
-    Xf = num.fft.fft(x, N, axis=0)
-    h = num.zeros(N)
+    Xf = num.fft.rfft(x, N, axis=0)
+    h = num.empty(Xf.shape[0], dtype=num.complex)
+    h[:] = -1j
+    h[0] = 0.
     if N % 2 == 0:
-        h[0] = h[N//2] = 1
-        h[1:N//2] = 2
-    else:
-        h[0] = 1
-        h[1:(N+1)//2] = 2
+        h[N//2] = 0.
 
     if len(x.shape) > 1:
         h = h[:, num.newaxis]
-    x = num.fft.ifft(Xf*h)
-    return x
+
+    n = min(N, x.shape[0])
+    y = num.zeros((N,) + x.shape[1:], dtype=num.complex)
+    y.real[:n] = x[:n]
+    y.imag = num.fft.irfft(Xf*h, N, axis=0)
+    return y
 
 
 def near(a, b, eps):
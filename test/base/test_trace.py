@@ -784,6 +784,19 @@ class TraceTestCase(unittest.TestCase):
         # tr2.ydata += tr1.ydata.mean()
         assert numeq(tr1.ydata, tr2.ydata, 0.01)
 
+    def test_hilbert(self):
+        from scipy import signal
+        for n in [100, 101]:
+            x = num.random.normal(size=n)
+            for N in [None, 64, 77, 256, 255]:
+                a = trace.hilbert(x, N)
+                b = signal.hilbert(x, N)
+                assert a.shape == b.shape
+                assert numeq(a, b, 1e-9)
+
+        x = num.random.normal(size=(100, 3))
+        assert numeq(trace.hilbert(x), signal.hilbert(x, axis=0), 1e-9)
+
     def test_muliply_taper(self):
 
         taper = trace.CosTaper(0., 1., 2., 3.)
@@ -359,6 +359,26 @@ class GFTestCase(unittest.TestCase):
                     points=sample_points,
                     interpolation=interp)
 
+            depths = store.config.get_source_depths()
+            mus = store.config.get_shear_moduli(
+                lat=0., lon=0.,
+                points=num.array([[0., 0., d] for d in depths]),
+                interpolation='nearest_neighbor')
+
+            num.testing.assert_allclose(
+                store.config.get_shear_moduli(
+                    lat=0., lon=0.,
+                    points=sample_points,
+                    interpolation='multilinear'),
+                num.interp(sample_points[:, 2], depths, mus))
+
+            sample_points[-1, 2] = depths[-1] + 1.
+            with self.assertRaises(gf.OutOfBounds):
+                store.config.get_shear_moduli(
+                    lat=0., lon=0.,
+                    points=sample_points,
+                    interpolation='multilinear')
+
     def test_partial_get(self):
         nrecords = 8
         random.seed(0)
@@ -679,6 +699,47 @@ class GFTestCase(unittest.TestCase):
                 logger.warning(
                     'test_stf_pre_post: max difference of %.1f %%' % perc)
 
+    def test_stf_post_precision(self):
+        store_dir = self.get_pulse_store_dir()
+        engine = gf.LocalEngine(store_dirs=[store_dir])
+
+        source = gf.ExplosionSource(
+            depth=200.,
+            moment=1.0,
+            stf=gf.HalfSinusoidSTF(duration=0.5),
+            stf_mode='post')
+
+        for quantity in ['displacement', 'acceleration']:
+            target = gf.Target(
+                quantity=quantity,
+                codes=('', 'STA', '', 'Z'),
+                north_shift=500.,
+                east_shift=0.,
+                store_id='pulse')
+
+            tr = engine.process(source, target).pyrocko_traces()[0]
+            assert tr.ydata.dtype == num.float32
+
+            # reference computed in double precision throughout
+            rule = engine.get_rule(source, target)
+            base_seismogram, _ = engine.base_seismogram(
+                source, target, rule.required_components(target), {}, 0)
+
+            for base_tr in base_seismogram.values():
+                base_tr.data = base_tr.data.astype(num.float64)
+
+            data = rule.apply_(target, base_seismogram)
+            _, amplitudes = source.effective_stf_post().discretize_t(
+                tr.deltat, 0.0)
+
+            padded = num.concatenate(
+                [data, num.full(amplitudes.size, data[-1])])
+            ref = num.convolve(
+                amplitudes * source.get_factor(), padded)[:-amplitudes.size]
+
+            assert tr.ydata.size == ref.size
+            assert numeq(tr.ydata, ref, 1e-6 * num.max(num.abs(ref)))
+
     def test_target_source_timing(self):
         store_dir = self.get_pulse_store_dir()
         engine = gf.LocalEngine(store_dirs=[store_dir])
@@ -709,6 +770,74 @@ class GFTestCase(unittest.TestCase):
             sum_data = num.sum(abs(tr.ydata))
             assert sum_data > 1.0
 
+    def test_process_timeseries_shared_receivers(self):
+        store_dir = self.get_pulse_store_dir()
+        engine = gf.LocalEngine(store_dirs=[store_dir])
+
+        source = gf.ExplosionSource(
+            depth=200.,
+            magnitude=4.,
+            time=0.)
+
+        targets = [
+            gf.Target(
+                codes=('', 'ST%d' % i, '', component),
+                north_shift=north_shift,
+                east_shift=500.,
+                tmin=tmin,
+                tmax=None if tmin is None else tmin+2.)
+
+            for component in 'ZNE'
+            for i, north_shift in enumerate([500., 700.])
+            for tmin in [None, 0.1]
+        ]
+
+        response_sum = engine.process(
+            source, targets, calc_timeseries=False)
+        response_calc = engine.process(
+            source, targets, calc_timeseries=True)
+
+        for (_, target, tr), (_, target_n, tr_n) in zip(
+                response_sum.iter_results(), response_calc.iter_results()):
+
+            assert target is target_n
+            num.testing.assert_equal(tr.get_xdata(), tr_n.get_xdata())
+            num.testing.assert_equal(tr.get_ydata(), tr_n.get_ydata())
+
+    def test_target_sin_cos_factors(self):
+        target = gf.Target(codes=('', 'STA', '', 'Z'))
+        num.testing.assert_almost_equal(
+            target.get_sin_cos_factors(), (0., 1., -1., 0.))
+
+        target.codes = ('', 'STA', '', 'E')
+        num.testing.assert_almost_equal(
+            target.get_sin_cos_factors(), (1., 0., 0., 1.))
+
+        target.azimuth = 180.
+        target.dip = 90.
+        num.testing.assert_almost_equal(
+            target.get_sin_cos_factors(), (0., -1., 1., 0.))
+
+    def test_scalar_rule(self):
+        tr = gf.GFTrace(num.arange(5, dtype=num.float32), 0, 0.5)
+        rule = gf.seismosizer.ScalarRule('pore_pressure')
+        num.testing.assert_equal(
+            rule.apply_(gf.Target(), {'pore_pressure': tr}), tr.data)
+
+    def test_make_same_span(self):
+        a = gf.GFTrace(num.array([1., 2., 3.], dtype=num.float32), 2, 0.5)
+        b = gf.GFTrace(num.array([4., 5.], dtype=num.float32), 0, 0.5)
+        out = gf.store.make_same_span(
+            {'a': a, 'b': b, 'z': gf.store.Zero})
+
+        for tr in out.values():
+            assert tr.itmin == 0
+            assert tr.data.size == 5
+
+        num.testing.assert_equal(out['a'].data, [1., 1., 1., 2., 3.])
+        num.testing.assert_equal(out['b'].data, [4., 5., 5., 5., 5.])
+        num.testing.assert_equal(out['z'].data, num.zeros(5))
+
     def test_target_store_deltat(self):
         store_dir = self.get_pulse_store_dir()
         engine = gf.LocalEngine(store_dirs=[store_dir])
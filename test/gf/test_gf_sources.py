@@ -185,6 +185,24 @@ class GFSourcesTestCase(unittest.TestCase):
         num.testing.assert_array_almost_equal(
             dips, expect)
 
+    def test_sgrid_getattr(self):
+        r = gf.Range
+        for order in [[], ['strike'], ['rake', 'depth']]:
+            sgrid = gf.SourceGrid(
+                base=gf.DCSource(dip=30.),
+                variables=dict(
+                    strike=r(0, 90, 30),
+                    depth=r(1*km, 3*km, n=3),
+                    rake=r(-10, 10, n=2),
+                    dip=r(1, 2, 0.5, relative='mult')),
+                order=order)
+
+            for k in ['strike', 'depth', 'rake', 'dip', 'magnitude', 'lat']:
+                num.testing.assert_array_equal(
+                    getattr(sgrid, k),
+                    num.fromiter(
+                        (getattr(s, k) for s in sgrid), dtype=num.float))
+
     def dummy_store(self):
         if self._dummy_store is None:
 
@@ -495,6 +513,26 @@ class GFSourcesTestCase(unittest.TestCase):
             m2 = dsource.centroid().pyrocko_moment_tensor().scalar_moment()
             assert abs(m1 - m2) < abs(m1 + m2) * 1e-6
 
+    def test_discretize_rect_source_implementations(self):
+        stf = gf.HalfSinusoidSTF(duration=3.)
+        for anchor in ['top', 'center', 'bottom_left']:
+            for nucleation_x, nucleation_y in [
+                    (None, None), (-0.5*km, None), (1*km, 2.5*km)]:
+
+                results = []
+                for implementation in ['c', 'python']:
+                    results.append(gf.seismosizer.discretize_rect_source(
+                        num.array([1.*km, 2.*km]), 0.5,
+                        10., 1*km, 2*km, 10*km,
+                        40., 60., 5*km, 3*km,
+                        anchor, 2.5*km, stf=stf,
+                        nucleation_x=nucleation_x,
+                        nucleation_y=nucleation_y,
+                        implementation=implementation))
+
+                for a, b in zip(*results):
+                    assert numeq(a, b, 1e-6)
+
     def test_discretize_rect_source_stf(self):
 
         store = self.dummy_homogeneous_store()
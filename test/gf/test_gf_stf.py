@@ -116,6 +116,40 @@ class GFSTFTestCase(unittest.TestCase):
             d2 = stf.effective_duration
             assert abs(d2 - d1) < 1e-4
 
+    def test_convolve_stf(self):
+        data = num.random.normal(size=2000)
+        for duration in [0.5, 10., 100.]:
+            t, a = gf.HalfSinusoidSTF(duration=duration).discretize_t(
+                0.1, 0.0)
+
+            assert numeq(
+                gf.seismosizer.convolve_stf(a, data),
+                num.convolve(a, data), 1e-9)
+
+    def test_combine_convolve_stf(self):
+        factors = [0.5, -0.25, 1.0]
+        for nsamples in [1, 300]:
+            datas = [
+                num.random.normal(size=nsamples).astype(num.float32)
+                for _ in range(3)]
+
+            # 1, 5, 21, 81, 101 and 1001 samples, the C implementation is
+            # used for STFs shorter than 100 samples
+            for duration in [0.0, 0.5, 2., 8., 10., 100.]:
+                t, a = gf.HalfSinusoidSTF(duration=duration).discretize_t(
+                    0.1, 0.0)
+
+                a = a.astype(num.float32)
+                for n in [1, 3]:
+                    results = [
+                        gf.seismosizer.combine_convolve_stf(
+                            datas[:n], factors[:n], a,
+                            implementation=implementation)
+                        for implementation in ['c', 'python']]
+
+                    assert results[0].size == nsamples + a.size - 1
+                    assert numeq(results[0], results[1], 1e-4)
+
 
 if __name__ == '__main__':
     util.setup_logging('test_gf_stf', 'warning')